@@ -6,16 +6,23 @@ export default function BroadcastDimming({
 }: {
     transmitterUid: string;
 }) {
-    const [dimming, setDimming] = useState([0, 0, 0]);
+    type DimmingLevels = [number, number, number];
+
+    const [dimming, setDimming] = useState<DimmingLevels>([0, 0, 0]);
     const [loading, setLoading] = useState(true);
-    const [visual, setVisual] = useState([0, 0, 0]);
+    const [visual, setVisual] = useState<DimmingLevels>([0, 0, 0]);
+    // Last dimming levels loaded from or sent to the transmitter
+    const requested = useRef<DimmingLevels | null>(null);
 
     interface Dimming {
-        dimming_levels: Array<number>;
+        dimming_levels: DimmingLevels;
     }
 
     useEffect(() => {
+        let cancelled = false;
         const fetchData = async () => {
+            requested.current = null;
+            setLoading(true);
             if (transmitterUid == "ERROR" || transmitterUid == "") {
                 return;
             }
@@ -24,6 +31,10 @@ export default function BroadcastDimming({
                     "/api/lighting/" + transmitterUid + "/dim_broadcast"
                 );
                 const json: Dimming = await response.json();
+                if (cancelled) {
+                    return;
+                }
+                requested.current = json.dimming_levels;
                 setDimming(json.dimming_levels);
                 setVisual(json.dimming_levels);
                 setLoading(false);
@@ -32,18 +43,34 @@ export default function BroadcastDimming({
             }
         };
         fetchData();
+        return () => {
+            cancelled = true;
+        };
     }, [transmitterUid]);
     
     useEffect(() => {
-        const putDimming = async (dimming: Array<number>) => {
+        const putDimming = async (dimming: DimmingLevels) => {
             if (transmitterUid == "ERROR" || transmitterUid == "") {
                 return;
             }
+            // Skip the round trip before the levels are loaded or when
+            // nothing has changed
+            const previous = requested.current;
+            if (previous === null || dimming.every((d, i) => d == previous[i])) {
+                return;
+            }
+            requested.current = dimming;
+            // Roll back unless a newer PUT or another transmitter took over
+            const rollback = () => {
+                if (requested.current === dimming) {
+                    requested.current = previous;
+                }
+            };
             try {
                 const data = {
                     dimming_levels: dimming,
                 };
-                const _ = await fetch(
+                const response = await fetch(
                     "/api/lighting/" + transmitterUid + "/dim_broadcast",
                     {
                         method: "PUT",
@@ -53,8 +80,12 @@ export default function BroadcastDimming({
                         body: JSON.stringify(data),
                     }
                 );
+                if (!response.ok) {
+                    rollback();
+                }
             } catch (e) {
                 console.log(e);
+                rollback();
             }
         };
         putDimming(dimming);
@@ -76,7 +107,7 @@ export default function BroadcastDimming({
                         value={visual[0] / 10}
                         disabled={loading}
                         onChange={(e) => {
-                            const temp = [
+                            const temp: DimmingLevels = [
                                 Number(e.target.value) * 10,
                                 visual[1],
                                 visual[2],
@@ -102,7 +133,7 @@ export default function BroadcastDimming({
                         value={visual[1] / 10}
                         disabled={loading}
                         onChange={(e) => {
-                            const temp = [
+                            const temp: DimmingLevels = [
                                 visual[0],
                                 Number(e.target.value) * 10,
                                 visual[2],
@@ -128,10 +159,10 @@ export default function BroadcastDimming({
                         value={visual[2] / 10}
                         disabled={loading}
                         onChange={(e) => {
-                            const temp = [
+                            const temp: DimmingLevels = [
                                 visual[0],
+                                visual[1],
                                 Number(e.target.value) * 10,
-                                visual[2],
                             ];
                             setVisual(temp);
                         }}
@@ -39,7 +39,7 @@ export default function Sensor() {
       }
     };
     fetchData();
-  });
+  }, []);
 
   const get_measurement = async (id: number) => {
     try {